@@ -16,6 +16,10 @@ import {
 } from '@modelcontextprotocol/sdk/types.js';
 
 const MINOOTS_API_BASE = 'https://api-m3waemr5lq-uc.a.run.app';
+const DEFAULT_HEADERS = Object.freeze({
+  'Content-Type': 'application/json',
+  'User-Agent': 'MINOOTS-MCP-Server/1.0.0',
+});
 
 class MinootsMCPServer {
   constructor() {
@@ -37,10 +41,7 @@ class MinootsMCPServer {
   async makeAPIRequest(endpoint, options = {}) {
     const url = `${MINOOTS_API_BASE}${endpoint}`;
     const config = {
-      headers: {
-        'Content-Type': 'application/json',
-        'User-Agent': 'MINOOTS-MCP-Server/1.0.0',
-      },
+      headers: DEFAULT_HEADERS,
       ...options,
     };
 
@@ -511,18 +512,16 @@ class MinootsMCPServer {
   // Utility methods
   formatDuration(ms) {
     if (ms <= 0) return '0s';
-    
-    const seconds = Math.floor(ms / 1000);
-    const minutes = Math.floor(seconds / 60);
-    const hours = Math.floor(minutes / 60);
-    
-    if (hours > 0) {
-      return `${hours}h ${minutes % 60}m ${seconds % 60}s`;
-    } else if (minutes > 0) {
-      return `${minutes}m ${seconds % 60}s`;
-    } else {
-      return `${seconds}s`;
-    }
+
+    const totalSeconds = Math.floor(ms / 1000);
+    const seconds = totalSeconds % 60;
+    const totalMinutes = (totalSeconds - seconds) / 60;
+    const minutes = totalMinutes % 60;
+    const hours = (totalMinutes - minutes) / 60;
+
+    if (hours > 0) return `${hours}h ${minutes}m ${seconds}s`;
+    if (minutes > 0) return `${minutes}m ${seconds}s`;
+    return `${seconds}s`;
   }
 
   getProgressBar(progress) {
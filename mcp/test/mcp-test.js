@@ -33,15 +33,28 @@ class MCPTester {
       let response = '';
       let error = '';
 
+      // Let the streams decode UTF-8 themselves; this also keeps multi-byte
+      // characters (the emoji in tool output) intact across chunk boundaries
+      server.stdout.setEncoding('utf8');
+      server.stderr.setEncoding('utf8');
+
       server.stdout.on('data', (data) => {
-        response += data.toString();
+        response += data;
       });
 
       server.stderr.on('data', (data) => {
-        error += data.toString();
+        error += data;
       });
 
+      // Kill the server if it hangs; cleared as soon as it exits so finished
+      // requests don't leave a pending timer holding the test process open
+      const timeout = setTimeout(() => {
+        server.kill();
+        reject(new Error('Request timeout'));
+      }, 10000);
+
       server.on('close', (code) => {
+        clearTimeout(timeout);
         if (code !== 0 && error) {
           reject(new Error(`Server error: ${error}`));
         } else {
@@ -59,12 +72,6 @@ class MCPTester {
       // Send the request
       server.stdin.write(JSON.stringify(request) + '\n');
       server.stdin.end();
-
-      // Timeout after 10 seconds
-      setTimeout(() => {
-        server.kill();
-        reject(new Error('Request timeout'));
-      }, 10000);
     });
   }
 
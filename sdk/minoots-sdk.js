@@ -6,43 +6,184 @@
  * Base URL: https://api-m3waemr5lq-uc.a.run.app
  */
 
+// Duration grammar: an integer value followed by a unit suffix ("30s", "5m").
+const DURATION_UNITS = Object.freeze(Object.assign(Object.create(null), {
+    ms: 1, s: 1000, m: 60000, h: 3600000, d: 86400000
+}));
+
+// Consecutive-failure circuit breaker. One breaker is shared by every SDK
+// instance talking to the same base URL through the same transport (fetch
+// implementation or dispatcher), so an outage trips once per process and
+// callers fail fast instead of each waiting out the request timeout, while a
+// misconfigured custom fetch cannot block instances using a different one.
+class CircuitBreaker {
+    constructor(failureThreshold = 5, recoveryMs = 30000) {
+        this.failureThreshold = failureThreshold;
+        this.recoveryMs = recoveryMs;
+        this.state = 'closed';
+        this.failures = 0;
+        this.openedAt = 0;
+    }
+
+    allow() {
+        if (this.state === 'closed') return true;
+        if (this.state === 'open' && Date.now() - this.openedAt >= this.recoveryMs) {
+            // Half-open: let a single probe through while others keep failing fast
+            this.state = 'half-open';
+            return true;
+        }
+        return false;
+    }
+
+    recordSuccess() {
+        this.state = 'closed';
+        this.failures = 0;
+    }
+
+    recordFailure() {
+        this.failures++;
+        if (this.state === 'half-open' || this.failures >= this.failureThreshold) {
+            this.state = 'open';
+            this.openedAt = Date.now();
+        }
+    }
+}
+
+// transport -> (baseURL -> breaker); weakly held so discarded custom fetch
+// functions and dispatchers don't keep their breakers alive
+const circuitBreakers = new WeakMap();
+const DEFAULT_TRANSPORT = {};
+
+function getCircuitBreaker(baseURL, transport) {
+    let byURL = circuitBreakers.get(transport);
+    if (!byURL) {
+        byURL = new Map();
+        circuitBreakers.set(transport, byURL);
+    }
+    let breaker = byURL.get(baseURL);
+    if (!breaker) {
+        breaker = new CircuitBreaker();
+        byURL.set(baseURL, breaker);
+    }
+    return breaker;
+}
+
 class MinootsSDK {
     constructor(options = {}) {
         this.baseURL = options.baseURL || 'https://api-m3waemr5lq-uc.a.run.app';
         this.defaultAgentId = options.agentId || 'sdk_agent';
         this.defaultTeam = options.team;
         this.timeout = options.timeout || 10000;
+
+        // A dispatcher only means something to Node's built-in (undici) fetch;
+        // a custom fetch such as node-fetch would silently ignore it
+        if (options.fetch && options.dispatcher) {
+            throw new Error('The dispatcher option only applies to the built-in fetch; configure pooling on the custom fetch instead');
+        }
+
+        // Node's built-in fetch keeps a process-wide keep-alive pool, so repeated
+        // calls reuse warm connections; callers may inject their own (e.g. a
+        // pooled agent). The global is looked up per call so polyfills
+        // installed after construction still take effect.
+        const customFetch = options.fetch;
+        this._fetch = customFetch
+            ? (url, init) => customFetch(url, init)
+            : (url, init) => globalThis.fetch(url, init);
+
+        // Request headers never vary per call; build them once and share them.
+        this._headers = Object.freeze({ 'Content-Type': 'application/json' });
+
+        // Optional undici dispatcher (e.g. an Agent with a larger keep-alive
+        // pool or pipelining) forwarded to Node's built-in fetch.
+        this.dispatcher = options.dispatcher;
+
+        // In-flight GET requests keyed by endpoint, so concurrent identical
+        // reads (e.g. several pollers on one timer) share a single round-trip.
+        // Callers joining a pending read get their own copy of the result.
+        this._inflight = new Map();
+
+        this._breaker = getCircuitBreaker(this.baseURL, options.fetch || options.dispatcher || DEFAULT_TRANSPORT);
     }
 
     // Internal HTTP client
-    async _request(method, endpoint, data = null) {
+    _request(method, endpoint, data = null) {
+        if (method !== 'GET') {
+            return this._send(method, endpoint, data);
+        }
+
+        const pending = this._inflight.get(endpoint);
+        if (pending) return pending.then(result => structuredClone(result));
+
+        const request = this._send(method, endpoint, data).finally(() => {
+            this._inflight.delete(endpoint);
+        });
+        this._inflight.set(endpoint, request);
+        return request;
+    }
+
+    async _send(method, endpoint, data = null) {
         const url = `${this.baseURL}${endpoint}`;
         const config = {
             method,
-            headers: {
-                'Content-Type': 'application/json'
-            }
+            headers: this._headers
         };
 
         if (data) {
             config.body = JSON.stringify(data);
         }
 
+        if (this.dispatcher) {
+            config.dispatcher = this.dispatcher;
+        }
+
+        if (typeof AbortSignal !== 'undefined' && AbortSignal.timeout) {
+            config.signal = AbortSignal.timeout(this.timeout);
+        }
+
+        if (!this._breaker.allow()) {
+            throw new Error(`Circuit open: MINOOTS API at ${this.baseURL} is failing, retry later`);
+        }
+
+        // The timeout signal covers reading the body too, so both steps share
+        // one error path and the breaker is only updated once the call settles
+        let response;
+        let result;
         try {
-            const response = await fetch(url, config);
-            const result = await response.json();
-            
-            if (!response.ok) {
-                throw new Error(`API Error (${response.status}): ${result.error || response.statusText}`);
-            }
-            
-            return result;
+            response = await this._fetch(url, config);
+            result = await response.json();
         } catch (error) {
-            if (error.name === 'TypeError' && error.message.includes('fetch')) {
-                throw new Error(`Network error: Unable to connect to MINOOTS API at ${url}`);
+            // Check the signal rather than the error name: undici rejects with a
+            // TimeoutError, while node-fetch reports every abort as AbortError
+            if (config.signal && config.signal.aborted) {
+                this._breaker.recordFailure();
+                throw new Error(`Timeout error: MINOOTS API at ${url} did not respond within ${this.timeout}ms`);
+            }
+            if (!response) {
+                this._breaker.recordFailure();
+                if (error.name === 'TypeError' && error.message.includes('fetch')) {
+                    throw new Error(`Network error: Unable to connect to MINOOTS API at ${url}`);
+                }
+                throw error;
             }
+            this._recordResponse(response);
             throw error;
         }
+
+        this._recordResponse(response);
+
+        if (!response.ok) {
+            throw new Error(`API Error (${response.status}): ${result.error || response.statusText}`);
+        }
+
+        return result;
+    }
+
+    _recordResponse(response) {
+        if (response.status >= 500) {
+            this._breaker.recordFailure();
+        } else {
+            this._breaker.recordSuccess();
+        }
     }
 
     // Health check
@@ -52,6 +193,9 @@ class MinootsSDK {
 
     // Timer Management
     async createTimer(config) {
+        // Reject malformed durations locally instead of paying a round-trip
+        if (typeof config.duration === 'string') this.parseDuration(config.duration);
+
         const timerConfig = {
             name: config.name,
             duration: config.duration,
@@ -66,6 +210,34 @@ class MinootsSDK {
         return await this._request('POST', '/timers', timerConfig);
     }
 
+    // Create several timers concurrently, keeping at most `concurrency`
+    // requests in flight. Like Promise.allSettled, each config gets its own
+    // { status, value | reason } entry (in input order), so one failure
+    // neither hides the timers that were created nor stops the rest.
+    async createTimers(configs, options = {}) {
+        const concurrency = Math.max(1, options.concurrency || 8);
+        const results = new Array(configs.length);
+        let next = 0;
+
+        const worker = async () => {
+            while (next < configs.length) {
+                const index = next++;
+                try {
+                    results[index] = { status: 'fulfilled', value: await this.createTimer(configs[index]) };
+                } catch (reason) {
+                    results[index] = { status: 'rejected', reason };
+                }
+            }
+        };
+
+        const workers = [];
+        for (let i = 0; i < Math.min(concurrency, configs.length); i++) {
+            workers.push(worker());
+        }
+        await Promise.all(workers);
+        return results;
+    }
+
     async getTimer(timerId) {
         return await this._request('GET', `/timers/${timerId}`);
     }
@@ -87,6 +259,8 @@ class MinootsSDK {
 
     // Quick timer creation
     async quickWait(duration, options = {}) {
+        if (typeof duration === 'string') this.parseDuration(duration);
+
         const config = {
             duration,
             name: options.name || `quick_wait_${Date.now()}`,
@@ -108,27 +282,39 @@ class MinootsSDK {
     // Utility methods
     parseDuration(duration) {
         if (typeof duration === 'number') return duration;
-        const units = { 'ms': 1, 's': 1000, 'm': 60000, 'h': 3600000, 'd': 86400000 };
-        const match = duration.toString().match(/^(\d+)([a-z]+)$/i);
-        if (!match) throw new Error(`Invalid duration: ${duration}`);
-        const [, value, unit] = match;
-        const multiplier = units[unit.toLowerCase()];
+        const text = typeof duration === 'string' ? duration : String(duration);
+
+        // Scan the leading digits by hand; the grammar is too small to need a regex
+        let i = 0;
+        while (i < text.length) {
+            const code = text.charCodeAt(i);
+            if (code < 48 || code > 57) break;
+            i++;
+        }
+        if (i === 0 || i === text.length) throw new Error(`Invalid duration: ${duration}`);
+
+        // The unit must be letters only ("1.5h" and "5 s" are malformed, not unknown units)
+        for (let j = i; j < text.length; j++) {
+            const code = text.charCodeAt(j) | 0x20;
+            if (code < 97 || code > 122) throw new Error(`Invalid duration: ${duration}`);
+        }
+
+        const unit = text.slice(i);
+        const multiplier = DURATION_UNITS[unit.toLowerCase()];
         if (!multiplier) throw new Error(`Unknown unit: ${unit}`);
-        return parseInt(value) * multiplier;
+        return parseInt(text.slice(0, i), 10) * multiplier;
     }
 
     formatTimeRemaining(milliseconds) {
-        const seconds = Math.floor(milliseconds / 1000);
-        const minutes = Math.floor(seconds / 60);
-        const hours = Math.floor(minutes / 60);
-        
-        if (hours > 0) {
-            return `${hours}h ${minutes % 60}m ${seconds % 60}s`;
-        } else if (minutes > 0) {
-            return `${minutes}m ${seconds % 60}s`;
-        } else {
-            return `${seconds}s`;
-        }
+        const totalSeconds = Math.max(0, Math.floor(milliseconds / 1000));
+        const seconds = totalSeconds % 60;
+        const totalMinutes = (totalSeconds - seconds) / 60;
+        const minutes = totalMinutes % 60;
+        const hours = (totalMinutes - minutes) / 60;
+
+        if (hours > 0) return `${hours}h ${minutes}m ${seconds}s`;
+        if (minutes > 0) return `${minutes}m ${seconds}s`;
+        return `${seconds}s`;
     }
 
     // Advanced timer methods
@@ -161,21 +347,26 @@ class MinootsSDK {
 
     // Agent coordination methods
     async waitFor(duration, agentId = null) {
-        const timer = await this.quickWait(duration, {
+        // Validate once; the API accepts milliseconds, so quickWait gets the parsed value
+        const durationMs = this.parseDuration(duration);
+        const timer = await this.quickWait(durationMs, {
             agentId: agentId || this.defaultAgentId,
             name: `wait_${agentId || this.defaultAgentId}_${Date.now()}`
         });
 
         // Return a promise that resolves when the timer expires
         return new Promise((resolve) => {
-            const durationMs = this.parseDuration(duration);
             setTimeout(() => {
                 resolve(timer);
             }, durationMs);
         });
     }
 
-    async pollTimer(timerId, intervalMs = 1000) {
+    async pollTimer(timerId, intervalMs = 1000, options = {}) {
+        const maxIntervalMs = options.maxIntervalMs || 30000;
+        const backoffBase = options.backoffBase || 1.3;
+        let attempt = 0;
+
         return new Promise((resolve, reject) => {
             const poll = async () => {
                 try {
@@ -193,8 +384,14 @@ class MinootsSDK {
                         return;
                     }
 
-                    // Continue polling
-                    setTimeout(poll, intervalMs);
+                    // Continue polling with jittered exponential backoff, but never
+                    // sleep past the reported expiry so the last poll lands on time
+                    let delay = Math.min(maxIntervalMs, intervalMs * Math.pow(backoffBase, attempt++));
+                    delay *= 0.5 + Math.random() * 0.5;
+                    if (typeof timer.timeRemaining === 'number') {
+                        delay = Math.min(delay, timer.timeRemaining);
+                    }
+                    setTimeout(poll, delay);
                 } catch (error) {
                     reject(error);
                 }
@@ -75,6 +75,19 @@ class TestRunner {
     }
 }
 
+// Offline helper: a fetch stand-in that records each call and answers with
+// the { status, body } returned by `handler`
+function createMockFetch(handler) {
+    const calls = [];
+    const fetch = async (url, init) => {
+        calls.push({ url, init });
+        const { status = 200, body = {} } = await handler(url, init, calls.length);
+        return { ok: status < 400, status, statusText: String(status), json: async () => body };
+    };
+    fetch.calls = calls;
+    return fetch;
+}
+
 // Test suite
 const runner = new TestRunner();
 
@@ -85,6 +98,31 @@ runner.test('SDK Initialization', async () => {
     await runner.assertEqual(runner.sdk.defaultTeam, 'sdk_test_team', 'Team should be set');
 });
 
+// Test 1b: dispatcher cannot be combined with a custom fetch
+runner.test('Dispatcher Requires Built-in Fetch', async () => {
+    try {
+        new MinootsSDK({ fetch: createMockFetch(() => ({})), dispatcher: {} });
+        throw new Error('Should have rejected dispatcher with a custom fetch');
+    } catch (error) {
+        await runner.assert(error.message.includes('dispatcher option only applies'), 'Should get proper error message');
+    }
+});
+
+// Test 1c: the global fetch is resolved per call, not at construction
+runner.test('Late Global Fetch Polyfill', async () => {
+    const realFetch = globalThis.fetch;
+    const sdk = new MinootsSDK({ baseURL: 'https://polyfill.example.com' });
+    const polyfill = createMockFetch(() => ({ body: { status: 'healthy' } }));
+    globalThis.fetch = polyfill;
+    try {
+        const health = await sdk.health();
+        await runner.assertEqual(health.status, 'healthy', 'Polyfill installed after construction should be used');
+        await runner.assertEqual(polyfill.calls.length, 1, 'Request should go through the polyfill');
+    } finally {
+        globalThis.fetch = realFetch;
+    }
+});
+
 // Test 2: Health check
 runner.test('Health Check', async () => {
     const health = await runner.sdk.health();
@@ -94,18 +132,61 @@ runner.test('Health Check', async () => {
 });
 
 // Test 3: Duration parsing
+const DURATION_CASES = [
+    ['5s', 5000],
+    ['2m', 120000],
+    ['1h', 3600000],
+    ['250ms', 250],
+    [10000, 10000]
+];
+
 runner.test('Duration Parsing', async () => {
-    await runner.assertEqual(runner.sdk.parseDuration('5s'), 5000, '5s should be 5000ms');
-    await runner.assertEqual(runner.sdk.parseDuration('2m'), 120000, '2m should be 120000ms');
-    await runner.assertEqual(runner.sdk.parseDuration('1h'), 3600000, '1h should be 3600000ms');
-    await runner.assertEqual(runner.sdk.parseDuration(10000), 10000, 'Number should pass through');
+    for (const [input, expected] of DURATION_CASES) {
+        await runner.assertEqual(runner.sdk.parseDuration(input), expected, `${input} should be ${expected}ms`);
+    }
 });
 
 // Test 4: Time formatting
+const FORMAT_CASES = [
+    [5000, '5s'],
+    [65000, '1m 5s'],
+    [3665000, '1h 1m 5s'],
+    [-500, '0s']
+];
+
 runner.test('Time Formatting', async () => {
-    await runner.assertEqual(runner.sdk.formatTimeRemaining(5000), '5s', '5000ms should format as 5s');
-    await runner.assertEqual(runner.sdk.formatTimeRemaining(65000), '1m 5s', '65000ms should format as 1m 5s');
-    await runner.assertEqual(runner.sdk.formatTimeRemaining(3665000), '1h 1m 5s', '3665000ms should format as 1h 1m 5s');
+    for (const [input, expected] of FORMAT_CASES) {
+        await runner.assertEqual(runner.sdk.formatTimeRemaining(input), expected, `${input}ms should format as ${expected}`);
+    }
+});
+
+// Test 4b: pollTimer backoff grows, caps, and clamps to timeRemaining
+runner.test('Poll Backoff Schedule', async () => {
+    const remaining = [10000, 10000, 10000, 10000, 10000, 10000, 40, 0];
+    const fetch = createMockFetch((url, init, n) => ({
+        body: { success: true, timer: { id: 't-1', status: remaining[n - 1] > 0 ? 'running' : 'expired', timeRemaining: remaining[n - 1] } }
+    }));
+    const sdk = new MinootsSDK({ fetch });
+
+    // Record each scheduled wait and run it right away; pin jitter to its upper bound
+    const delays = [];
+    const realSetTimeout = global.setTimeout;
+    const realRandom = Math.random;
+    global.setTimeout = (fn, ms) => {
+        delays.push(Math.round(ms));
+        return realSetTimeout(fn, 0);
+    };
+    Math.random = () => 1;
+    try {
+        const timer = await sdk.pollTimer('t-1', 100, { maxIntervalMs: 250 });
+        await runner.assertEqual(timer.status, 'expired', 'Should resolve with the expired timer');
+    } finally {
+        global.setTimeout = realSetTimeout;
+        Math.random = realRandom;
+    }
+
+    await runner.assertEqual(fetch.calls.length, remaining.length, 'Should poll until the timer expires');
+    await runner.assertEqual(delays.join(','), '100,130,169,220,250,250,40', 'Waits should grow by 1.3x, cap at 250ms, and clamp to timeRemaining');
 });
 
 // Test 5: Timer creation
@@ -126,6 +207,39 @@ runner.test('Timer Creation', async () => {
     runner.createdTimerId = result.timer.id;
 });
 
+// Test 5b: Batch timer creation
+runner.test('Batch Timer Creation', async () => {
+    const results = await runner.sdk.createTimers([
+        { name: 'test_batch_one', duration: '10s' },
+        { name: 'test_batch_two', duration: '10s' }
+    ], { concurrency: 2 });
+
+    await runner.assertEqual(results.length, 2, 'Should create one timer per config');
+    await runner.assertEqual(results[0].status, 'fulfilled', 'First timer should be created');
+    await runner.assertEqual(results[0].value.timer.name, 'test_batch_one', 'Results should keep input order');
+    await runner.assertEqual(results[1].value.timer.name, 'test_batch_two', 'Results should keep input order');
+});
+
+// Test 5c: Batch timer creation reports partial failures per item
+runner.test('Batch Timer Creation Partial Failure', async () => {
+    const fetch = createMockFetch((url, init) => {
+        const body = JSON.parse(init.body);
+        if (body.name === 'bad') return { status: 400, body: { success: false, error: 'rejected' } };
+        return { status: 201, body: { success: true, timer: { name: body.name } } };
+    });
+    const sdk = new MinootsSDK({ fetch });
+    const names = ['bad', 'a', 'b', 'c', 'd'];
+    const results = await sdk.createTimers(names.map(name => ({ name, duration: '1s' })), { concurrency: 2 });
+
+    await runner.assertEqual(fetch.calls.length, names.length, 'Every config should be attempted once');
+    await runner.assertEqual(results[0].status, 'rejected', 'Failed item should be reported as rejected');
+    await runner.assert(results[0].reason.message.includes('rejected'), 'Rejection should carry the API error');
+    for (let i = 1; i < names.length; i++) {
+        await runner.assertEqual(results[i].status, 'fulfilled', `${names[i]} should be reported as created`);
+        await runner.assertEqual(results[i].value.timer.name, names[i], 'Results should keep input order');
+    }
+});
+
 // Test 6: Timer retrieval
 runner.test('Timer Retrieval', async () => {
     await runner.assert(runner.createdTimerId, 'Should have created timer ID from previous test');
@@ -138,6 +252,142 @@ runner.test('Timer Retrieval', async () => {
     await runner.assertExists(result.timer.progress, 'Timer should have progress');
 });
 
+// Test 6b: Concurrent identical reads share one request
+runner.test('Concurrent Read Coalescing', async () => {
+    let release;
+    const gate = new Promise(resolve => { release = resolve; });
+    const fetch = createMockFetch(async () => {
+        await gate;
+        return { body: { success: true, timer: { id: 't-1', labels: {} } } };
+    });
+    const sdk = new MinootsSDK({ fetch });
+
+    const pending = [1, 2, 3, 4].map(() => sdk.getTimer('t-1'));
+    await runner.assertEqual(sdk._inflight.size, 1, 'Concurrent reads should share one in-flight entry');
+    release();
+    const results = await Promise.all(pending);
+
+    await runner.assertEqual(fetch.calls.length, 1, 'Concurrent reads should make a single request');
+    await runner.assertEqual(sdk._inflight.size, 0, 'In-flight entry should be removed once settled');
+    await runner.assert(results.every(r => r.timer.id === 't-1'), 'Every caller should get the timer');
+    results[0].timer.labels.mutated = true;
+    await runner.assert(results.slice(1).every(r => r !== results[0] && !r.timer.labels.mutated), 'Callers should get independent copies');
+
+    await sdk.getTimer('t-1');
+    await runner.assertEqual(fetch.calls.length, 2, 'A later read should issue a new request');
+    const failing = new MinootsSDK({ fetch: createMockFetch(() => ({ status: 404, body: { error: 'Timer not found' } })) });
+    const failures = await Promise.allSettled([failing.getTimer('t-2'), failing.getTimer('t-2')]);
+    await runner.assert(failures.every(r => r.status === 'rejected'), 'Every caller should see the failure');
+    await runner.assertEqual(failing._inflight.size, 0, 'In-flight entry should be removed after a failure');
+});
+
+// Test 6c: Circuit breaker trips, fails fast, probes once, and recovers
+runner.test('Circuit Breaker Lifecycle', async () => {
+    let status = 503;
+    let release = null;
+    const fetch = createMockFetch(async () => {
+        if (release) await new Promise(resolve => { release = resolve; });
+        return { status, body: { success: status < 400, error: 'down' } };
+    });
+    const sdk = new MinootsSDK({ fetch, baseURL: 'https://breaker.example.com' });
+
+    for (let i = 0; i < 5; i++) {
+        await sdk.health().catch(() => {});
+    }
+    await runner.assertEqual(sdk._breaker.state, 'open', 'Breaker should open after 5 consecutive 5xx responses');
+
+    const fastFailure = await sdk.health().catch(error => error);
+    await runner.assert(fastFailure.message.includes('Circuit open'), 'Open breaker should reject immediately');
+    await runner.assertEqual(fetch.calls.length, 5, 'Open breaker should not reach the network');
+
+    // Once the recovery window passes, only one probe is let through
+    sdk._breaker.openedAt -= sdk._breaker.recoveryMs;
+    status = 200;
+    release = () => {};
+    const probes = [sdk.getTimer('a'), sdk.getTimer('b'), sdk.health()].map(p => p.then(() => 'ok', error => error.message));
+    await new Promise(resolve => setImmediate(resolve));
+    await runner.assertEqual(fetch.calls.length, 6, 'Half-open breaker should send a single probe');
+    release();
+    const outcomes = await Promise.all(probes);
+    await runner.assertEqual(outcomes[0], 'ok', 'Probe should succeed');
+    await runner.assert(outcomes.slice(1).every(o => o.includes('Circuit open')), 'Other calls should fail fast during the probe');
+
+    release = null;
+    await runner.assertEqual(sdk._breaker.state, 'closed', 'Successful probe should close the breaker');
+    await sdk.health();
+    await runner.assertEqual(fetch.calls.length, 7, 'Closed breaker should let requests through');
+});
+
+// Test 6d: Breakers are isolated per transport and body-read timeouts are reported
+runner.test('Circuit Breaker Isolation and Timeouts', async () => {
+    const baseURL = 'https://isolation.example.com';
+    const broken = new MinootsSDK({ baseURL, fetch: async () => { throw new TypeError('fetch failed'); } });
+    for (let i = 0; i < 5; i++) {
+        await broken.health().catch(() => {});
+    }
+    await runner.assertEqual(broken._breaker.state, 'open', 'Broken fetch should trip its own breaker');
+
+    const healthy = new MinootsSDK({ baseURL, fetch: createMockFetch(() => ({ body: { status: 'healthy' } })) });
+    const health = await healthy.health();
+    await runner.assertEqual(health.status, 'healthy', 'Other transports on the same URL should be unaffected');
+
+    // Response body stalls until the request timeout aborts it
+    const stalled = new MinootsSDK({
+        baseURL,
+        timeout: 50,
+        fetch: async (url, init) => ({
+            ok: true,
+            status: 200,
+            json: () => new Promise((resolve, reject) => {
+                init.signal.addEventListener('abort', () => reject(init.signal.reason));
+            })
+        })
+    });
+    const keepAlive = setTimeout(() => {}, 1000);
+    const timeoutError = await stalled.health().catch(error => error);
+    clearTimeout(keepAlive);
+    await runner.assert(timeoutError.message.includes('Timeout error'), 'Body-read timeout should be reported as a timeout');
+    await runner.assertEqual(stalled._breaker.failures, 1, 'Body-read timeout should count as a breaker failure');
+});
+
+// Test 6e: node-fetch style aborts (AbortError) are reported as timeouts
+runner.test('Circuit Breaker AbortError Timeouts', async () => {
+    // node-fetch rejects every abort with an error named AbortError
+    const abortOn = (signal, reject) => signal.addEventListener('abort', () => {
+        const error = new Error('The operation was aborted.');
+        error.name = 'AbortError';
+        reject(error);
+    });
+    const keepAlive = setTimeout(() => {}, 1000);
+
+    try {
+        const connectStall = new MinootsSDK({
+            baseURL: 'https://abort.example.com',
+            timeout: 30,
+            fetch: (url, init) => new Promise((resolve, reject) => abortOn(init.signal, reject))
+        });
+        const connectError = await connectStall.health().catch(error => error);
+        await runner.assert(connectError.message.includes('Timeout error'), 'Aborted fetch should be reported as a timeout');
+        await runner.assertEqual(connectStall._breaker.failures, 1, 'Aborted fetch should count as a breaker failure');
+
+        const bodyStall = new MinootsSDK({
+            baseURL: 'https://abort.example.com',
+            timeout: 30,
+            fetch: async (url, init) => ({
+                ok: true,
+                status: 200,
+                json: () => new Promise((resolve, reject) => abortOn(init.signal, reject))
+            })
+        });
+        const bodyError = await bodyStall.health().catch(error => error);
+        await runner.assert(bodyError.message.includes('Timeout error'), 'Aborted body read should be reported as a timeout');
+        await runner.assertEqual(bodyStall._breaker.failures, 1, 'Aborted body read should count as a breaker failure');
+        await runner.assertEqual(bodyStall._breaker.state, 'closed', 'A single timeout should not open the breaker');
+    } finally {
+        clearTimeout(keepAlive);
+    }
+});
+
 // Test 7: Timer listing
 runner.test('Timer Listing', async () => {
     const result = await runner.sdk.listTimers();
@@ -222,6 +472,23 @@ runner.test('Error Handling', async () => {
     } catch (error) {
         await runner.assert(error.message.includes('Invalid duration'), 'Should get proper error message');
     }
+
+    for (const malformed of ['1.5h', '5 s', '5s!']) {
+        try {
+            runner.sdk.parseDuration(malformed);
+            throw new Error(`Should have thrown an error for ${malformed}`);
+        } catch (error) {
+            await runner.assert(error.message.includes('Invalid duration'), `${malformed} should be reported as an invalid duration`);
+        }
+    }
+
+    try {
+        // Invalid durations should be rejected before any request is sent
+        await runner.sdk.createTimer({ name: 'test_invalid_duration', duration: 'invalid' });
+        throw new Error('Should have rejected timer with invalid duration');
+    } catch (error) {
+        await runner.assert(error.message.includes('Invalid duration'), 'Should get proper error message');
+    }
 });
 
 // Run tests